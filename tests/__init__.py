@@ -1,9 +1,11 @@
+import functools
 import os
 
 BASE_PATH = os.path.abspath(os.path.dirname(__file__))
 RESOURCES_PATH = os.path.join(BASE_PATH, "resources/")
 
 
+@functools.lru_cache(maxsize=None)
 def load_resource(resource):
     with open(os.path.join(RESOURCES_PATH, resource)) as f:
         return f.read()
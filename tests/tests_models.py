@@ -1,15 +1,36 @@
+import concurrent.futures
 import sqlite3
 import unittest
 
 from tests import load_resource
 from tibiawikisql import Article, models, schema
+from tibiawikisql.models import abc
+
+
+def _configure(conn):
+    # Test databases only live in memory, so there's nothing to protect by journaling, syncing or locking.
+    for pragma in ("journal_mode=OFF", "synchronous=OFF", "temp_store=MEMORY", "locking_mode=EXCLUSIVE",
+                   "cache_size=-32768"):
+        conn.execute(f"PRAGMA {pragma}")
 
 
 class TestModels(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The schema is created once and dumped into a single script, every test replays it into a fresh database.
+        template = sqlite3.connect(":memory:")
+        schema.create_tables(template)
+        cls.schema_script = "\n".join(template.iterdump())
+        template.close()
+
     def setUp(self):
-        self.conn = sqlite3.connect(":memory:")
+        self.conn = sqlite3.connect(":memory:", cached_statements=512)
+        self.conn.executescript(self.schema_script)
         self.conn.row_factory = sqlite3.Row
-        schema.create_tables(self.conn)
+        _configure(self.conn)
+
+    def tearDown(self):
+        self.conn.close()
 
     def test_achievement(self):
         article = Article(1, "Demonic Barkeeper", timestamp="2018-08-20T04:33:15Z",
@@ -17,7 +38,8 @@ class TestModels(unittest.TestCase):
         achievement = models.Achievement.from_article(article)
         self.assertIsInstance(achievement, models.Achievement)
 
-        achievement.insert(self.conn)
+        with self.conn:
+            achievement.insert(self.conn)
         db_achievement = models.Achievement.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_achievement, models.Achievement)
@@ -32,13 +54,23 @@ class TestModels(unittest.TestCase):
         creature = models.Creature.from_article(article)
         self.assertIsInstance(creature, models.Creature)
 
-        creature.insert(self.conn)
+        with self.conn:
+            models.Item(article_id=2, title="Gold Coin", name="gold coin").insert(self.conn)
+            models.Item(article_id=3, title="Demonic Essence", name="demonic essence").insert(self.conn)
+            creature.insert(self.conn)
         db_creature: models.Creature = models.Creature.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_creature, models.Creature)
         self.assertEqual(db_creature.name, creature.name)
         self.assertEqual(db_creature.modifier_earth, creature.modifier_earth)
         self.assertGreater(len(db_creature.loot), 0)
+        gold_coin_drops = [drop for drop in db_creature.loot if drop.item_id == 2]
+        self.assertEqual(len(gold_coin_drops), 1)
+        self.assertEqual(gold_coin_drops[0].item_title, "Gold Coin")
+        # Loot keeps the article's order, whether the item was found or not.
+        item_ids = {"Gold Coin": 2, "Demonic Essence": 3}
+        self.assertEqual([drop.item_id for drop in db_creature.loot],
+                         [item_ids.get(drop.item_title) for drop in creature.loot])
 
         # Dynamic properties
         self.assertEqual(50, db_creature.charm_points)
@@ -56,7 +88,8 @@ class TestModels(unittest.TestCase):
         house = models.House.from_article(article)
         self.assertIsInstance(house, models.House)
 
-        house.insert(self.conn)
+        with self.conn:
+            house.insert(self.conn)
         db_house = models.House.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_house, models.House)
@@ -65,13 +98,18 @@ class TestModels(unittest.TestCase):
         models.House.get_by_field(self.conn, "house_id", 55302)
         self.assertIsInstance(db_house, models.House)
 
+        article = Article(2, "Fire Sword", timestamp="2018-08-20T04:33:15Z",
+                          content=load_resource("content_item.txt"))
+        self.assertIsNone(models.House.from_article(article))
+
     def test_imbuement(self):
         article = Article(1, "Powerful Strike", timestamp="2018-08-20T04:33:15Z",
                           content=load_resource("content_imbuement.txt"))
         imbuement = models.Imbuement.from_article(article)
         self.assertIsInstance(imbuement, models.Imbuement)
 
-        imbuement.insert(self.conn)
+        with self.conn:
+            imbuement.insert(self.conn)
         db_imbuement = models.Imbuement.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_imbuement, models.Imbuement)
@@ -88,7 +126,8 @@ class TestModels(unittest.TestCase):
         item = models.Item.from_article(article)
         self.assertIsInstance(item, models.Item)
 
-        item.insert(self.conn)
+        with self.conn:
+            item.insert(self.conn)
         db_item = models.Item.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_item, models.Item)
@@ -106,6 +145,44 @@ class TestModels(unittest.TestCase):
         db_item = models.Item.get_by_field(self.conn, "name", "fire sword", use_like=True)
         self.assertIsInstance(db_item, models.Item)
 
+    def test_item_get_many(self):
+        items = []
+        for article_id, resource in enumerate(["content_item.txt", "content_item_resist.txt"], 1):
+            article = Article(article_id, f"Item {article_id}", timestamp="2018-08-20T04:33:15Z",
+                              content=load_resource(resource))
+            items.append(models.Item.from_article(article))
+        with self.conn:
+            for item in items:
+                item.insert(self.conn)
+            # Children are inserted out of order and mixed between items, to check their grouping and sorting.
+            for creature_id, item_id, chance in [(10, 1, 5.5), (11, 2, 20.0), (12, 1, 50.0), (13, 1, 0.5)]:
+                schema.CreatureDrop.insert(self.conn, creature_id=creature_id, item_id=item_id, chance=chance)
+            for npc_id, item_id, value in [(20, 1, 300), (21, 1, 100), (22, 2, 50), (23, 1, 200)]:
+                schema.NpcSelling.insert(self.conn, npc_id=npc_id, item_id=item_id, value=value, currency_id=2)
+                schema.NpcBuying.insert(self.conn, npc_id=npc_id, item_id=item_id, value=value, currency_id=2)
+
+        def drops(item):
+            return [(d.creature_id, d.chance) for d in item.dropped_by]
+
+        def offers(offer_list):
+            return [(o.npc_id, o.value, o.currency_title) for o in offer_list]
+
+        db_items = models.Item.get_many(self.conn, [2, 3, 1])
+        self.assertEqual([i.article_id for i in db_items], [2, 1])
+        for db_item, item in zip(db_items, reversed(items)):
+            self.assertEqual(db_item.name, item.name)
+            expected = models.Item.get_by_field(self.conn, "article_id", item.article_id)
+            self.assertEqual(db_item.attributes_dict, expected.attributes_dict)
+            self.assertEqual(drops(db_item), drops(expected))
+            self.assertEqual(offers(db_item.sold_by), offers(expected.sold_by))
+            self.assertEqual(offers(db_item.bought_by), offers(expected.bought_by))
+        self.assertEqual(drops(db_items[1]), [(12, 50.0), (10, 5.5), (13, 0.5)])
+        self.assertEqual([o.value for o in db_items[1].sold_by], [100, 200, 300])
+        self.assertEqual([o.value for o in db_items[1].bought_by], [300, 200, 100])
+
+        db_items = models.Item.get_many(self.conn, (i for i in [1, 2, 1]))
+        self.assertEqual([i.article_id for i in db_items], [1, 2])
+
     def test_item_resist(self):
         article = Article(1, "Dream Shroud", timestamp="2018-08-20T04:33:15Z",
                           content=load_resource("content_item_resist.txt"))
@@ -121,7 +198,8 @@ class TestModels(unittest.TestCase):
         self.assertEqual(len(item.resistances), 1)
         self.assertEqual(item.resistances["energy"], 10)
 
-        item.insert(self.conn)
+        with self.conn:
+            item.insert(self.conn)
         db_item = models.Item.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_item, models.Item)
@@ -138,7 +216,8 @@ class TestModels(unittest.TestCase):
         self.assertIsInstance(item, models.Item)
         self.assertEqual(len(item.sounds), 6)
 
-        item.insert(self.conn)
+        with self.conn:
+            item.insert(self.conn)
         db_item = models.Item.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_item, models.Item)
@@ -154,7 +233,8 @@ class TestModels(unittest.TestCase):
         key = models.Key.from_article(article)
         self.assertIsInstance(key, models.Key)
 
-        key.insert(self.conn)
+        with self.conn:
+            key.insert(self.conn)
         db_key = models.Key.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_key, models.Key)
@@ -169,7 +249,8 @@ class TestModels(unittest.TestCase):
         npc = models.Npc.from_article(article)
         self.assertIsInstance(npc, models.Npc)
 
-        npc.insert(self.conn)
+        with self.conn:
+            npc.insert(self.conn)
         db_npc = models.Npc.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_npc, models.Npc)
@@ -192,7 +273,8 @@ class TestModels(unittest.TestCase):
         quest = models.Quest.from_article(article)
         self.assertIsInstance(quest, models.Quest)
 
-        quest.insert(self.conn)
+        with self.conn:
+            quest.insert(self.conn)
         db_quest = models.Quest.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_quest, models.Quest)
@@ -204,7 +286,8 @@ class TestModels(unittest.TestCase):
         spell = models.Spell.from_article(article)
         self.assertIsInstance(spell, models.Spell)
 
-        spell.insert(self.conn)
+        with self.conn:
+            spell.insert(self.conn)
         db_spell = models.Spell.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_spell, models.Spell)
@@ -217,7 +300,8 @@ class TestModels(unittest.TestCase):
         self.assertIsInstance(world, models.World)
         self.assertIsInstance(world.trade_board, int)
 
-        world.insert(self.conn)
+        with self.conn:
+            world.insert(self.conn)
         db_world = models.World.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_world, models.World)
@@ -232,7 +316,8 @@ class TestModels(unittest.TestCase):
         self.assertIsInstance(mount.speed, int)
         self.assertIsInstance(mount.buyable, int)
 
-        mount.insert(self.conn)
+        with self.conn:
+            mount.insert(self.conn)
         db_mount = models.Mount.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_mount, models.Mount)
@@ -248,12 +333,70 @@ class TestModels(unittest.TestCase):
         self.assertIsInstance(charm.effect, str)
         self.assertEqual(charm.version, "11.50")
 
-        charm.insert(self.conn)
+        with self.conn:
+            charm.insert(self.conn)
         db_charm = models.Charm.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_charm, models.Charm)
         self.assertEqual(db_charm.name, charm.name)
 
+    def test_stream_from_articles(self):
+        articles = [
+            Article(1, "Curse (Charm)", timestamp="2018-08-20T04:33:15Z", content=load_resource("content_charm.txt")),
+            Article(2, "Fire Sword", timestamp="2018-08-20T04:33:15Z", content=load_resource("content_item.txt")),
+        ]
+        with self.conn:
+            entries = list(models.Charm.stream_from_articles(self.conn, articles))
+
+        self.assertIsInstance(entries[0], models.Charm)
+        self.assertIsNone(entries[1])
+        self.assertEqual(len(models.Charm.search(self.conn)), 1)
+
+    def test_stream_from_articles_executor(self):
+        articles = [
+            Article(1, "Demon", timestamp="2018-08-20T04:33:15Z", content=load_resource("content_creature.txt")),
+            Article(2, "Fire Sword", timestamp="2018-08-20T04:33:15Z", content=load_resource("content_item.txt")),
+        ]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+            with self.conn:
+                entries = list(models.Creature.stream_from_articles(self.conn, articles, executor))
+
+        self.assertIsInstance(entries[0], models.Creature)
+        self.assertIsNone(entries[1])
+        db_creature = models.Creature.get_by_field(self.conn, "article_id", 1)
+        self.assertEqual(db_creature.name, entries[0].name)
+        self.assertEqual(len(db_creature.loot), len(entries[0].loot))
+
+    def test_stream_from_articles_executor_bounded(self):
+        read = []
+
+        def articles():
+            for i in range(1, 1001):
+                read.append(i)
+                yield Article(i, f"Article {i}", timestamp="2018-08-20T04:33:15Z", content="")
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            entries = models.Charm.stream_from_articles(self.conn, articles(), executor)
+            self.assertIsNone(next(entries))
+            self.assertLessEqual(len(read), abc.PARSE_CHUNK_SIZE * abc.PARSE_MAX_PENDING_CHUNKS)
+            self.assertEqual(sum(1 for _ in entries), 999)
+        self.assertEqual(len(read), 1000)
+
+    def test_insert_many(self):
+        article = Article(1, "Curse (Charm)", timestamp="2018-08-20T04:33:15Z",
+                          content=load_resource("content_charm.txt"))
+        charms = [
+            models.Charm.from_article(article),
+            models.Charm(article_id=2, title="Dodge", name="Dodge", type="Defensive", cost=600),
+            models.Charm(article_id=3, title="Zap", name="Zap", type="Offensive"),
+        ]
+        with self.conn:
+            models.Charm.insert_many(self.conn, charms)
+
+        db_charms = models.Charm.search(self.conn, sort_by="article_id")
+        self.assertEqual(len(db_charms), 3)
+        self.assertEqual([c.name for c in db_charms], [c.name for c in charms])
+
     def test_outfit(self):
         article = Article(1, "Barbarian Outfits", timestamp="2018-08-20T04:33:15Z",
                           content=load_resource("content_outfit.txt"))
@@ -262,7 +405,8 @@ class TestModels(unittest.TestCase):
         self.assertTrue(outfit.premium)
         self.assertEqual(outfit.achievement, "Brutal Politeness")
 
-        outfit.insert(self.conn)
+        with self.conn:
+            outfit.insert(self.conn)
         db_outfit = models.Outfit.get_by_field(self.conn, "article_id", 1)
 
         self.assertIsInstance(db_outfit, models.Outfit)
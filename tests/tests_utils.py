@@ -1,6 +1,8 @@
 import unittest
 
 from tests import load_resource
+from tibiawikisql.models.abc import parse_attributes
+from tibiawikisql.models.creature import parse_monster_walks
 from tibiawikisql.utils import clean_links, client_color_to_rgb, parse_boolean, parse_float, parse_integer, \
     parse_loot_statistics, parse_min_max, parse_sounds
 
@@ -59,3 +61,19 @@ class TestWikiApi(unittest.TestCase):
         self.assertEqual(client_color_to_rgb(3), 0x99)
         self.assertEqual(client_color_to_rgb(215), 0xffffff)
         self.assertEqual(client_color_to_rgb(216), 0)
+
+    def test_parse_attributes(self):
+        content = "{{Infobox Test|name = Test|links = [[A|B]], [[C]]|nested = {{Template|x=1}}|empty = }}"
+        attributes = parse_attributes(content)
+        self.assertEqual(attributes["name"], "Test")
+        self.assertEqual(attributes["links"], "[[A|B]], [[C]]")
+        self.assertEqual(attributes["nested"], "{{Template|x=1}}")
+        self.assertNotIn("empty", attributes)
+
+    def test_parse_monster_walks(self):
+        self.assertEqual(parse_monster_walks("Fire, Energy, Poison"), "fire,energy,poison")
+        self.assertEqual(parse_monster_walks("Poison?, fire"), "fire")
+        self.assertIsNone(parse_monster_walks("Poison?, fire."))
+        self.assertEqual(parse_monster_walks("Poison, earth, fire?, [[ice]]"), "poison,earth")
+        self.assertIsNone(parse_monster_walks("None"))
+        self.assertIsNone(parse_monster_walks("--"))
@@ -1,3 +1,5 @@
+import json
+import threading
 import unittest
 from unittest.mock import MagicMock
 
@@ -52,3 +54,35 @@ class TestWikiApi(unittest.TestCase):
         self.assertEqual(image.file_name, titles[0])
         self.assertEqual(image.extension, ".gif")
         self.assertEqual(image.clean_name, "Golden Armor")
+
+    def test_articles_in_batches(self):
+        def get(url, params):
+            titles = params["titles"].split("|")
+            pages = {str(i): {"pageid": int(t), "title": t, "revisions": [{"timestamp": "2018-08-20T04:33:15Z",
+                                                                            "*": "content"}]}
+                     for i, t in enumerate(titles)}
+            response = MagicMock()
+            response.text = json.dumps({"query": {"pages": pages}})
+            return response
+
+        api.requests.Session.get = MagicMock(side_effect=get)
+        titles = [str(i) for i in range(1, 231)]
+        articles = list(WikiClient.get_articles(titles))
+        self.assertEqual(api.requests.Session.get.call_count, 5)
+        self.assertEqual([a.title for a in articles], titles)
+
+    def test_batches_session_per_thread(self):
+        sessions = {}
+
+        def get(session, url, params):
+            sessions.setdefault(threading.get_ident(), set()).add(id(session))
+            response = MagicMock()
+            response.text = json.dumps({"query": {"pages": {}}})
+            return response
+
+        api.requests.Session.get = get
+        list(WikiClient.get_articles([str(i) for i in range(1, 501)]))
+        used = [session for thread_sessions in sessions.values() for session in thread_sessions]
+        # Each thread uses a single session, and no session is shared between threads.
+        self.assertTrue(all(len(thread_sessions) == 1 for thread_sessions in sessions.values()))
+        self.assertEqual(len(used), len(set(used)))
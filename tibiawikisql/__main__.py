@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import concurrent.futures
 import datetime
 import os
 import platform
@@ -30,6 +31,17 @@ from tibiawikisql.utils import parse_loot_statistics, parse_min_max
 
 DATABASE_FILE = "tibiawiki.db"
 
+OUTFIT_IMAGE_TEMPLATES = (
+    ("Outfit %s Male.gif", 0, "Male"),
+    ("Outfit %s Male Addon 1.gif", 1, "Male"),
+    ("Outfit %s Male Addon 2.gif", 2, "Male"),
+    ("Outfit %s Male Addon 3.gif", 3, "Male"),
+    ("Outfit %s Female.gif", 0, "Female"),
+    ("Outfit %s Female Addon 1.gif", 1, "Female"),
+    ("Outfit %s Female Addon 2.gif", 2, "Female"),
+    ("Outfit %s Female Addon 3.gif", 3, "Female"),
+)
+
 colorama.init()
 
 
@@ -82,10 +94,10 @@ def generate(skip_images, db_name):
     """Generates a database file."""
     command_start = time.perf_counter()
     print("Connecting to database...")
-    conn = sqlite3.connect(db_name)
+    conn = sqlite3.connect(db_name, cached_statements=512)
     print("Creating schema...")
     schema.create_tables(conn)
-    conn.execute("PRAGMA synchronous = OFF")
+    schema.configure_write_connection(conn)
     data_store = {}
     get_articles("Deprecated", data_store)
 
@@ -96,35 +108,39 @@ def generate(skip_images, db_name):
             pass
 
     print("Parsing articles...")
-    for key, value in categories.items():
-        model = value.model
-        if not issubclass(model, abc.Parseable):
-            continue
-        titles = [a.title for a in data_store[key]]
-        unparsed = []
-        exec_time = time.perf_counter()
-        generator = WikiClient.get_articles(titles)
-        with conn:
-            with progress_bar(generator, f"Parsing {key}", len(titles), item_show_func=article_show) as bar:
-                for i, article in enumerate(bar):
-                    entry = model.from_article(article)
-                    if entry is not None:
-                        entry.insert(conn)
-                    else:
-                        unparsed.append(titles[i])
-            if unparsed:
-                print(f"\33[31m\tCould not parse {len(unparsed):,} articles.\033[0m")
-                print("\t-> \33[31m%s\033[0m" % '\033[0m,\33[31m'.join(unparsed))
-            dt = (time.perf_counter() - exec_time)
-            print(f"\33[32m\tParsed articles in {dt:.2f} seconds.\033[0m")
-
-    for position in rashid_positions:
-        position.insert(conn)
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        for key, value in categories.items():
+            model = value.model
+            if not issubclass(model, abc.Parseable):
+                continue
+            titles = [a.title for a in data_store[key]]
+            unparsed = []
+            exec_time = time.perf_counter()
+            generator = WikiClient.get_articles(titles)
+            with conn:
+                with progress_bar(generator, f"Parsing {key}", len(titles), item_show_func=article_show) as bar:
+                    for i, entry in enumerate(model.stream_from_articles(conn, bar, executor)):
+                        if entry is None:
+                            unparsed.append(titles[i])
+                if unparsed:
+                    print(f"\33[31m\tCould not parse {len(unparsed):,} articles.\033[0m")
+                    print("\t-> \33[31m%s\033[0m" % '\033[0m,\33[31m'.join(unparsed))
+                dt = (time.perf_counter() - exec_time)
+                print(f"\33[32m\tParsed articles in {dt:.2f} seconds.\033[0m")
+
+    models.RashidPosition.insert_many(conn, rashid_positions)
 
     c = conn.cursor()
     try:
-        results = conn.execute("SELECT title FROM creature")
-        titles = [f"Loot Statistics:{t[0]}" for t in results]
+        # Ids are looked up once instead of querying them for every article and loot entry.
+        # Titles are case insensitive in the database, so they are looked up in lowercase.
+        titles = []
+        creature_ids = {}
+        for title, article_id in conn.execute("SELECT title, article_id FROM creature"):
+            titles.append(f"Loot Statistics:{title}")
+            creature_ids[title.lower()] = article_id
+        item_ids = {title.lower(): article_id
+                    for title, article_id in conn.execute("SELECT title, article_id FROM item")}
         start_time = time.perf_counter()
         with progress_bar(WikiClient.get_articles(titles), "Fetching loot statistics", len(titles),
                           item_show_func=article_show) as bar:
@@ -132,12 +148,10 @@ def generate(skip_images, db_name):
                 if article is None:
                     continue
                 creature_title = article.title.replace("Loot Statistics:", "")
-                c.execute("SELECT article_id from creature WHERE title = ?", (creature_title,))
-                result = c.fetchone()
-                if result is None:
+                creature_id = creature_ids.get(creature_title.lower())
+                if creature_id is None:
                     # This could happen if a creature's article was deleted but its Loot Statistics weren't
                     continue
-                creature_id = result[0]
                 # Most loot statistics contain stats for older versions too, we onl care about the latest version.
                 try:
                     exec_time = article.content.index("Loot2")
@@ -149,11 +163,9 @@ def generate(skip_images, db_name):
                 kills, loot_stats = parse_loot_statistics(content)
                 loot_items = []
                 for item, times, amount in loot_stats:
-                    c.execute("SELECT article_id FROM item WHERE title LIKE ?", (item,))
-                    result = c.fetchone()
-                    if result is None:
+                    item_id = item_ids.get(item.lower())
+                    if item_id is None:
                         continue
-                    item_id = result[0]
                     percentage = min(int(times) / kills * 100, 100)
                     _min, _max = parse_min_max(amount)
                     loot_items.append((creature_id, item_id, percentage, _min, _max))
@@ -178,11 +190,14 @@ def generate(skip_images, db_name):
             save_maps(conn)
     with conn:
         gen_time = datetime.datetime.utcnow()
-        schema.DatabaseInfo.insert(conn, **{"key": "timestamp", "value": str(gen_time.timestamp())})
-        schema.DatabaseInfo.insert(conn, **{"key": "generate_time", "value": str(gen_time)})
-        schema.DatabaseInfo.insert(conn, **{"key": "version", "value": __version__})
-        schema.DatabaseInfo.insert(conn, **{"key": "python_version", "value": platform.python_version()})
-        schema.DatabaseInfo.insert(conn, **{"key": "platform", "value": platform.platform()})
+        schema.DatabaseInfo.insert_many(conn, [
+            {"key": "timestamp", "value": str(gen_time.timestamp())},
+            {"key": "generate_time", "value": str(gen_time)},
+            {"key": "version", "value": __version__},
+            {"key": "python_version", "value": platform.python_version()},
+            {"key": "platform", "value": platform.platform()},
+        ])
+    conn.close()
 
     dt = (time.perf_counter() - command_start)
     print(f"Command finished in {dt:.2f} seconds.")
@@ -206,10 +221,12 @@ def save_images(conn, key, value):
     column = "name" if value.no_title else "title"
     results = conn.execute(f"SELECT {column} FROM {table}")
     titles = [f"{r[0]}{extension}" for r in results]
-    os.makedirs(f"images/{table}", exist_ok=True)
+    folder = f"images/{table}"
+    os.makedirs(folder, exist_ok=True)
     cache_count = 0
     fetch_count = 0
     failed = []
+    updates = []
     start = time.perf_counter()
     generator = WikiClient.get_images_info(titles)
     with progress_bar(generator, f"Fetching {key} images", len(titles), item_show_func=img_show) as bar:
@@ -217,7 +234,7 @@ def save_images(conn, key, value):
             if image is None:
                 continue
             try:
-                with open(f"images/{table}/{image.file_name}", "rb") as f:
+                with open(f"{folder}/{image.file_name}", "rb") as f:
                     image_bytes = f.read()
                 cache_count += 1
             except FileNotFoundError:
@@ -225,12 +242,13 @@ def save_images(conn, key, value):
                 r.raise_for_status()
                 image_bytes = r.content
                 fetch_count += 1
-                with open(f"images/{table}/{image.file_name}", "wb") as f:
+                with open(f"{folder}/{image.file_name}", "wb") as f:
                     f.write(image_bytes)
             except requests.HTTPError:
                 failed.append(image.file_name)
                 continue
-            conn.execute(f"UPDATE {table} SET image = ? WHERE {column} = ?", (image_bytes, image.clean_name))
+            updates.append((image_bytes, image.clean_name))
+    conn.executemany(f"UPDATE {table} SET image = ? WHERE {column} = ?", updates)
     dt = (time.perf_counter() - start)
     if failed:
         print(f"\33[31m\tCould not fetch {len(failed):,} images.\033[0m")
@@ -244,38 +262,28 @@ def save_outfit_images(conn):
         return
     category = categories["outfits"]
     table = category.model.table.__tablename__
-    os.makedirs(f"images/{table}", exist_ok=True)
+    folder = f"images/{table}"
+    os.makedirs(folder, exist_ok=True)
     results = conn.execute(f"SELECT article_id, name FROM {table}")
     image_info = {}
     titles = []
-    name_templates = [
-        "Outfit %s Male.gif",
-        "Outfit %s Male Addon 1.gif",
-        "Outfit %s Male Addon 2.gif",
-        "Outfit %s Male Addon 3.gif",
-        "Outfit %s Female.gif",
-        "Outfit %s Female Addon 1.gif",
-        "Outfit %s Female Addon 2.gif",
-        "Outfit %s Female Addon 3.gif",
-    ]
-    addon_sequence = (0, 1, 2, 3, 0, 1, 2, 3)
-    sex_sequence = ["Male"]*4 + ["Female"]*4
     for article_id, name in results:
-        for i, image_name in enumerate(name_templates):
-            file_name = image_name % name
-            image_info[file_name] = [article_id, addon_sequence[i], sex_sequence[i]]
+        for name_template, addons, sex in OUTFIT_IMAGE_TEMPLATES:
+            file_name = name_template % name
+            image_info[file_name] = (article_id, addons, sex)
             titles.append(file_name)
     generator = WikiClient.get_images_info(titles)
     cache_count = 0
     fetch_count = 0
     failed = []
+    rows = []
     start = time.perf_counter()
     with progress_bar(generator, f"Fetching outfit images", len(titles), item_show_func=img_show) as bar:
         for image in bar:
             if image is None:
                 continue
             try:
-                with open(f"images/{table}/{image.file_name}", "rb") as f:
+                with open(f"{folder}/{image.file_name}", "rb") as f:
                     image_bytes = f.read()
                 cache_count += 1
             except FileNotFoundError:
@@ -283,14 +291,14 @@ def save_outfit_images(conn):
                 r.raise_for_status()
                 image_bytes = r.content
                 fetch_count += 1
-                with open(f"images/{table}/{image.file_name}", "wb") as f:
+                with open(f"{folder}/{image.file_name}", "wb") as f:
                     f.write(image_bytes)
             except requests.HTTPError:
                 failed.append(image.file_name)
                 continue
             article_id, addons, sex = image_info[image.file_name]
-            conn.execute(f"INSERT INTO outfit_image(outfit_id, addon, sex, image) VALUES(?, ?, ?, ?)",
-                         (article_id, addons, sex, image_bytes))
+            rows.append((article_id, addons, sex, image_bytes))
+    conn.executemany(f"INSERT INTO outfit_image(outfit_id, addon, sex, image) VALUES(?, ?, ?, ?)", rows)
     dt = (time.perf_counter() - start)
     if failed:
         print(f"\33[31m\tCould not fetch {len(failed):,} images.\033[0m")
@@ -303,10 +311,11 @@ def get_articles(category, data_store, key=None, include_deprecated=False):
     if key is None:
         key = category.lower()
     print(f"Fetching articles in \33[94mCategory:{category}\033[0m...")
+    deprecated = {a.article_id for a in data_store.get("deprecated", [])}
     data_store[key] = []
     start = time.perf_counter()
     for article in WikiClient.get_category_members(category):
-        if article not in data_store.get("deprecated", []) or include_deprecated:
+        if include_deprecated or article.article_id not in deprecated:
             data_store[key].append(article)
     dt = (time.perf_counter() - start)
     print(f"\33[32m\tFound {len(data_store[key]):,} articles in {dt:.2f} seconds.\033[0m")
@@ -315,6 +324,7 @@ def get_articles(category, data_store, key=None, include_deprecated=False):
 def save_maps(con):
     url = "https://tibiamaps.github.io/tibia-map-data/floor-{0:02d}-map.png"
     os.makedirs(f"images/map", exist_ok=True)
+    rows = []
     for z in range(16):
         try:
             with open(f"images/map/{z}.png", "rb") as f:
@@ -327,7 +337,8 @@ def save_maps(con):
                 f.write(image)
         except requests.HTTPError:
             continue
-        con.execute(f"INSERT INTO map(z, image) VALUES(?,?)", (z, image))
+        rows.append((z, image))
+    con.executemany(f"INSERT INTO map(z, image) VALUES(?,?)", rows)
 
 
 if __name__ == "__main__":
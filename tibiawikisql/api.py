@@ -12,8 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import collections
+import concurrent.futures
 import datetime
 import json
+import threading
 import urllib.parse
 
 import requests
@@ -42,6 +45,7 @@ class WikiEntry:
     timestamp : :class:`int`
         The date of the entry's last edit, represented as a unix timestamp.
     """
+    __slots__ = ("article_id", "title", "timestamp")
 
     def __init__(self, article_id, title, timestamp=None):
         self.article_id = article_id
@@ -82,6 +86,7 @@ class Article(WikiEntry):
     content: :class:`str`
         The article's source content.
     """
+    __slots__ = ("content",)
 
     def __init__(self, article_id, title, *, timestamp=None, content=None):
         super().__init__(article_id, title, timestamp)
@@ -103,6 +108,8 @@ class Image(WikiEntry):
     file_url: str
         The image's url.
     """
+    __slots__ = ("file_url",)
+
     def __init__(self, article_id, title, *, timestamp=None, file_url=None):
         super().__init__(article_id, title, timestamp)
         self.file_url = file_url
@@ -136,6 +143,9 @@ class WikiClient:
         'User-Agent': f'tibiawikisql {__version__}'
     }
 
+    max_workers = 4
+    """:class:`int`: The maximum number of requests to do concurrently when fetching titles in batches."""
+
     @classmethod
     def get_category_members(cls, name, skip_index=True):
         """
@@ -241,22 +251,13 @@ class WikiClient:
         :class:`Image`
             An image's information.
         """
-        i = 0
-        s = requests.Session()
-        s.headers.update(cls.headers)
         params = {
             "action": "query",
             "prop": "imageinfo",
             "iiprop": "url|timestamp",
             "format": "json"
         }
-        while True:
-            if i >= len(names):
-                break
-            params["titles"] = "|".join(f"File:{n}" for n in names[i:min(i + 50, len(names))])
-            i += 50
-            r = s.get(cls.ENDPOINT, params=params)
-            data = json.loads(r.text)
+        for data in cls._get_batches(params, [f"File:{n}" for n in names]):
             for _, image in data["query"]["pages"].items():
                 if "missing" in image:
                     yield None
@@ -287,22 +288,13 @@ class WikiClient:
         :class:`Article`
             An article in the list of names.
         """
-        i = 0
-        s = requests.Session()
-        s.headers.update(cls.headers)
         params = {
             "action": "query",
             "prop": "revisions",
             "rvprop": "content|timestamp",
             "format": "json"
         }
-        while True:
-            if i >= len(names):
-                break
-            params["titles"] = "|".join(names[i:min(i+50, len(names))])
-            i += 50
-            r = s.get(cls.ENDPOINT, params=params)
-            data = json.loads(r.text)
+        for data in cls._get_batches(params, names):
             for _, article in data["query"]["pages"].items():
                 if "missing" in article:
                     yield None
@@ -328,3 +320,49 @@ class WikiClient:
         """
         gen = cls.get_articles([name])
         return next(gen)
+
+    @classmethod
+    def _get_batches(cls, params, titles):
+        """
+        Generator that queries the API for a list of titles, in batches of 50 titles.
+
+        Up to :py:attr:`max_workers` batches are requested concurrently, responses are yielded in order.
+
+        Parameters
+        ----------
+        params: :class:`dict`
+            The query parameters, without the titles.
+        titles: list[:class:`str`]
+            The titles to query.
+
+        Yields
+        -------
+        :class:`dict`
+            The decoded response of each batch.
+        """
+        # Sessions are not guaranteed to be thread safe, so every worker thread gets its own.
+        local = threading.local()
+        sessions = []
+
+        def fetch(batch):
+            s = getattr(local, "session", None)
+            if s is None:
+                s = local.session = requests.Session()
+                s.headers.update(cls.headers)
+                sessions.append(s)
+            r = s.get(cls.ENDPOINT, params={**params, "titles": "|".join(batch)})
+            return json.loads(r.text)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=cls.max_workers) as executor:
+                # Only a few batches are requested ahead, so responses don't pile up if they're consumed slowly.
+                pending = collections.deque()
+                for i in range(0, len(titles), 50):
+                    pending.append(executor.submit(fetch, titles[i:i + 50]))
+                    if len(pending) >= cls.max_workers:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+        finally:
+            for s in sessions:
+                s.close()
@@ -187,6 +187,7 @@ class TableMeta(type):
                 columns.append(value)
 
         dct['columns'] = columns
+        dct['_insert_queries'] = {}
         return super().__new__(mcs, name, parents, dct)
 
     def __init__(cls, name, parents, dct, **kwargs):
@@ -232,14 +233,46 @@ class Table(metaclass=TableMeta):
     @classmethod
     def insert(cls, c, **kwargs):
         """Inserts an element to the table."""
+        columns, values = cls._verify(kwargs)
+        c.execute(cls.get_insert_query(columns), values)
 
-        # verify column names:
-        verified = {}
+    @classmethod
+    def insert_many(cls, c, rows):
+        """Inserts multiple elements to the table.
+
+        Consecutive elements that contain the same columns are inserted with a single statement, so elements are
+        still inserted in the order given.
+
+        Parameters
+        ----------
+        c: :class:`sqlite3.Cursor`, :class:`sqlite3.Connection`
+            A cursor or connection of the database.
+        rows: iterable of :class:`dict`
+            The elements to insert, mapping column names to values.
+        """
+        batch_columns = None
+        batch = []
+        for row in rows:
+            columns, values = cls._verify(row)
+            if columns != batch_columns:
+                if batch:
+                    c.executemany(cls.get_insert_query(batch_columns), batch)
+                batch_columns = columns
+                batch = []
+            batch.append(values)
+        if batch:
+            c.executemany(cls.get_insert_query(batch_columns), batch)
+
+    @classmethod
+    def _verify(cls, kwargs):
+        # verify column names, collecting the names and values of the columns present, in table order:
+        columns = []
+        values = []
         for column in cls.columns:
-            try:
-                value = kwargs[column.name]
-            except KeyError:
+            # Most rows only set a few columns, so missing ones are skipped without raising an exception.
+            if column.name not in kwargs:
                 continue
+            value = kwargs[column.name]
 
             check = column.column_type.python
             if value is None and not column.nullable:
@@ -248,11 +281,33 @@ class Table(metaclass=TableMeta):
                 fmt = 'column {0.name} expected {1.__name__}, received {2.__class__.__name__}'
                 raise TypeError(fmt.format(column, check, value))
 
-            verified[column.name] = value
+            columns.append(column.name)
+            values.append(value)
+        return tuple(columns), values
+
+    @classmethod
+    def get_insert_query(cls, columns):
+        """Gets the INSERT statement for the given column names.
+
+        Statements are built once per set of columns and reused afterwards.
+
+        Parameters
+        ----------
+        columns: :class:`tuple` of :class:`str`
+            The names of the columns to insert, in the order their values will be passed.
 
-        sql = 'INSERT INTO {0} ({1}) VALUES ({2});'.format(cls.__tablename__, ', '.join(verified),
-                                                           ', '.join('?' for _ in verified))
-        c.execute(sql, tuple(verified.values()))
+        Returns
+        -------
+        :class:`str`
+            The INSERT statement, with a placeholder for each column.
+        """
+        try:
+            return cls._insert_queries[columns]
+        except KeyError:
+            sql = 'INSERT INTO {0} ({1}) VALUES ({2});'.format(cls.__tablename__, ', '.join(columns),
+                                                               ', '.join('?' for _ in columns))
+            cls._insert_queries[columns] = sql
+            return sql
 
     @classmethod
     def drop(cls):
@@ -13,11 +13,25 @@
 #  limitations under the License.
 
 import abc
+import collections
+import functools
+import re
 import sqlite3
 
 from tibiawikisql import database
 from tibiawikisql.api import Article
 
+delimiters_pattern = re.compile(r"([|={}\[\]])")
+
+PARSE_CACHE_MAX_LENGTH = 65536
+"""Articles longer than this are parsed without being added to the parse cache."""
+
+PARSE_CHUNK_SIZE = 32
+"""Number of articles sent to an executor at once when parsing articles in parallel."""
+
+PARSE_MAX_PENDING_CHUNKS = 8
+"""Maximum number of chunks waiting to be parsed by an executor, limiting how far ahead articles are read."""
+
 
 def parse_attributes(content):
     """
@@ -36,40 +50,55 @@ def parse_attributes(content):
     attributes = dict()
     depth = 0
     parse_value = False
-    attribute = ""
-    value = ""
-    for i in range(len(content)):
-        if content[i] == '{' or content[i] == '[':
+    attribute = []
+    value = []
+    # Only delimiters change the parser's state, so the content is split into the text before each delimiter and
+    # the delimiter itself. Text after the last delimiter is outside the template and is discarded.
+    tokens = delimiters_pattern.split(content)
+    for text, char in zip(tokens[::2], tokens[1::2]):
+        buffer = value if parse_value else attribute
+        if text:
+            buffer.append(text)
+        if char == '{' or char == '[':
             depth += 1
             if depth >= 3:
-                if parse_value:
-                    value = value + content[i]
-                else:
-                    attribute = attribute + content[i]
-        elif content[i] == '}' or content[i] == ']':
+                buffer.append(char)
+            continue
+        if char == '}' or char == ']':
             if depth >= 3:
-                if parse_value:
-                    value = value + content[i]
-                else:
-                    attribute = attribute + content[i]
-            if depth == 2:
-                attributes[attribute.strip()] = value.strip()
-                parse_value = False
-                attribute = ""
-                value = ""
+                buffer.append(char)
             depth -= 1
-        elif content[i] == '=' and depth == 2:
+            if depth != 1:
+                continue
+        elif depth != 2:
+            buffer.append(char)
+            continue
+        elif char == '=':
             parse_value = True
-        elif content[i] == '|' and depth == 2:
-            attributes[attribute.strip()] = value.strip()
-            parse_value = False
-            attribute = ""
-            value = ""
-        elif parse_value:
-            value = value + content[i]
+            continue
+        # The template's closing braces or a pipe mark the end of the current attribute.
+        name = "".join(attribute).strip()
+        stripped_value = "".join(value).strip()
+        if stripped_value:
+            attributes[name] = stripped_value
         else:
-            attribute = attribute + content[i]
-    return dict((k, v.strip()) for k, v in attributes.items() if v.strip())
+            # An empty value still overrides any previous value of the same attribute.
+            attributes.pop(name, None)
+        parse_value = False
+        attribute = []
+        value = []
+    return attributes
+
+
+def _parse_articles(cls, articles):
+    # Module level, so it can be pickled and sent to other processes along with the articles.
+    return [cls.from_article(article) for article in articles]
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_attributes_cached(content):
+    # The returned dictionary is shared between calls, so it must not be modified.
+    return parse_attributes(content)
 
 
 class Parseable(Article, metaclass=abc.ABCMeta):
@@ -88,6 +117,8 @@ class Parseable(Article, metaclass=abc.ABCMeta):
     timestamp: :class:`int`
         The last time the containing article was edited.
     """
+    __slots__ = ("_raw_attributes",)
+
     _map = None
     """map: :class:`dict`: A dictionary mapping the article's attributes to object attributes."""
     _pattern = None
@@ -119,16 +150,76 @@ class Parseable(Article, metaclass=abc.ABCMeta):
             "title": article.title,
             "attributes": dict(),
         }
-        attributes = parse_attributes(article.content)
-        row["_raw_attributes"] = {}
+        if len(article.content) < PARSE_CACHE_MAX_LENGTH:
+            attributes = _parse_attributes_cached(article.content)
+        else:
+            attributes = parse_attributes(article.content)
+        raw_attributes = row["_raw_attributes"] = {}
+        attribute_map = cls._map
         for attribute, value in attributes.items():
-            if attribute not in cls._map:
-                row["_raw_attributes"][attribute] = value
+            mapping = attribute_map.get(attribute)
+            if mapping is None:
+                raw_attributes[attribute] = value
                 continue
-            column, func = cls._map[attribute]
+            column, func = mapping
             row[column] = func(value)
         return cls(**row)
 
+    @classmethod
+    def stream_from_articles(cls, c, articles, executor=None):
+        """
+        Parses articles and inserts them into the database as they are received.
+
+        This is a generator: articles are only parsed and inserted as it is iterated, so it must be consumed entirely
+        for every article to be inserted. Calling it without iterating the result inserts nothing.
+
+        Models are not kept after being inserted, so memory usage doesn't grow with the number of articles.
+        Transactions are up to the caller, wrapping the whole iteration in a single one is recommended.
+
+        If an executor is provided, articles are parsed by it in chunks, while inserts are still done by the calling
+        thread. Only a limited number of chunks are pending at once, so articles are not read ahead of the parsing.
+        Parsing is CPU bound, so a :class:`concurrent.futures.ProcessPoolExecutor` is needed to use multiple cores.
+
+        Parameters
+        ----------
+        c: :class:`sqlite3.Cursor`, :class:`sqlite3.Connection`
+            A cursor or connection of the database.
+        articles: iterable of :class:`Article`
+            The articles to parse.
+        executor: :class:`concurrent.futures.Executor`, optional
+            The executor used to parse the articles.
+
+        Yields
+        ------
+        :class:`Type[abc.Parseable]`
+            The inserted model for each article, or ``None`` if the article couldn't be parsed.
+        """
+        if executor is None:
+            entries = map(cls.from_article, articles)
+        else:
+            entries = cls._parse_in_executor(executor, articles)
+        for entry in entries:
+            if entry is not None:
+                entry.insert(c)
+            yield entry
+
+    @classmethod
+    def _parse_in_executor(cls, executor, articles):
+        pending = collections.deque()
+        chunk = []
+        for article in articles:
+            chunk.append(article)
+            if len(chunk) < PARSE_CHUNK_SIZE:
+                continue
+            pending.append(executor.submit(_parse_articles, cls, chunk))
+            chunk = []
+            if len(pending) >= PARSE_MAX_PENDING_CHUNKS:
+                yield from pending.popleft().result()
+        if chunk:
+            pending.append(executor.submit(_parse_articles, cls, chunk))
+        while pending:
+            yield from pending.popleft().result()
+
 
 class Row(metaclass=abc.ABCMeta):
     """
@@ -139,20 +230,28 @@ class Row(metaclass=abc.ABCMeta):
     table: :class:`database.Table`
         The SQL table where this model is stored.
     """
+    __slots__ = ()
+
     table = None
 
     def __init__(self, **kwargs):
-        for c in self.table.columns:
-            value = kwargs.get(c.name, c.default)
+        for name, default, is_boolean in self._columns:
+            value = kwargs.get(name, default)
             # SQLite Booleans are actually stored as 0 or 1, so we convert to true boolean.
-            if isinstance(c.column_type, database.Boolean) and value is not None:
+            if is_boolean and value is not None:
                 value = bool(value)
-            setattr(self, c.name, value)
+            setattr(self, name, value)
         if kwargs.get("_raw_attributes"):
             self._raw_attributes = kwargs.get("_raw_attributes")
 
     def __init_subclass__(cls, table=None):
         cls.table = table
+        # Column names, defaults and whether they are booleans, frozen to avoid going through the table every time.
+        cls._columns = tuple((c.name, c.default, isinstance(c.column_type, database.Boolean))
+                             for c in table.columns) if table else ()
+        cls._column_names = frozenset(name for name, _, _ in cls._columns)
+        cls._field_queries = {}
+        cls._search_queries = {}
 
     def __repr__(self):
         key = "title"
@@ -164,7 +263,32 @@ class Row(metaclass=abc.ABCMeta):
 
     @classmethod
     def _is_column(cls, name):
-        return name in [c.name for c in cls.table.columns]
+        return name in cls._column_names
+
+    @classmethod
+    def _get_field_query(cls, field, use_like):
+        try:
+            return cls._field_queries[(field, use_like)]
+        except KeyError:
+            operator = "LIKE" if use_like else "="
+            query = f"SELECT * FROM {cls.table.__tablename__} WHERE {field} {operator} ? LIMIT 1"
+            cls._field_queries[(field, use_like)] = query
+            return query
+
+    @classmethod
+    def _get_search_query(cls, field, use_like, sort_by, ascending):
+        key = (field, use_like, sort_by, ascending)
+        try:
+            return cls._search_queries[key]
+        except KeyError:
+            operator = "LIKE" if use_like else "="
+            query = cls._get_base_query()
+            if field is not None:
+                query += f"\nWHERE {field} {operator} ?"
+            if sort_by is not None:
+                query += f"\nORDER BY {sort_by} {'ASC' if ascending else 'DESC'}"
+            cls._search_queries[key] = query
+            return query
 
     @classmethod
     def _get_base_query(cls):
@@ -179,16 +303,36 @@ class Row(metaclass=abc.ABCMeta):
         c: :class:`sqlite3.Cursor`, :class:`sqlite3.Connection`
             A cursor or connection of the database.
         """
+        self.table.insert(c, **self._get_insert_values())
+
+    @classmethod
+    def insert_many(cls, c, rows):
+        """
+        Inserts multiple models into their respective database table.
+
+        Models are inserted in batches, using a single statement for all models that have the same columns set.
+        Models that override :meth:`insert` are inserted one by one, so their extra logic is preserved.
+
+        Parameters
+        ----------
+        c: :class:`sqlite3.Cursor`, :class:`sqlite3.Connection`
+            A cursor or connection of the database.
+        rows: iterable of :class:`cls`
+            The models to insert.
+        """
+        if cls.insert is not Row.insert:
+            for row in rows:
+                row.insert(c)
+            return
+        cls.table.insert_many(c, (row._get_insert_values() for row in rows))
+
+    def _get_insert_values(self):
         rows = {}
-        for column in self.table.columns:
-            try:
-                value = getattr(self, column.name)
-                if value == column.default:
-                    continue
-                rows[column.name] = value
-            except AttributeError:
-                continue
-        self.table.insert(c, **rows)
+        for name, default, _ in self._columns:
+            value = getattr(self, name, default)
+            if value != default:
+                rows[name] = value
+        return rows
 
     @classmethod
     def from_row(cls, row):
@@ -205,8 +349,7 @@ class Row(metaclass=abc.ABCMeta):
         :class:`cls`
             An instance of the class, based on the row.
         """
-        if isinstance(row, sqlite3.Row):
-            row = dict(row)
+        # sqlite3.Row supports keys() and item access, so it can be unpacked as keyword arguments directly.
         return cls(**row)
 
     @classmethod
@@ -237,9 +380,7 @@ class Row(metaclass=abc.ABCMeta):
         # This is used to protect the query from possible SQL Injection.
         if not cls._is_column(field):
             raise ValueError(f"Field '{field}' doesn't exist.")
-        operator = "LIKE" if use_like else "="
-        query = f"SELECT * FROM {cls.table.__tablename__} WHERE {field} {operator} ? LIMIT 1"
-        c = c.execute(query, (value,))
+        c = c.execute(cls._get_field_query(field, use_like), (value,))
         c.row_factory = sqlite3.Row
         row = c.fetchone()
         if row is None:
@@ -284,23 +425,29 @@ class Row(metaclass=abc.ABCMeta):
             raise ValueError(f"Field '{field}' doesn't exist.")
         if sort_by is not None and not cls._is_column(sort_by):
             raise ValueError(f"Field '{sort_by}' doesn't exist.")
-        operator = "LIKE" if use_like else "="
-        query = cls._get_base_query()
-        tup = tuple()
-        if field is not None:
-            query += f"\nWHERE {field} {operator} ?"
-            tup = (value,)
-        if sort_by is not None:
-            query += f"\nORDER BY {sort_by} {'ASC' if ascending else 'DESC'}"
-        c = c.execute(query, tup)
+        query = cls._get_search_query(field, use_like, sort_by, ascending)
+        c = c.execute(query, (value,) if field is not None else ())
         c.row_factory = sqlite3.Row
-        results = []
-        for row in c.fetchall():
-            row = cls.from_row(row)
-            if row is not None:
-                results.append(row)
-        return results
-
-
-
+        return [row for row in map(cls.from_row, c) if row is not None]
 
+    @classmethod
+    def _search_many(cls, c, field, values, sort_by=None, ascending=True):
+        # Finds elements whose field matches any of the values, grouped by the field's value.
+        # Values are queried in chunks, to stay within SQLite's limit of parameters per query.
+        if not cls._is_column(field):
+            raise ValueError(f"Field '{field}' doesn't exist.")
+        if sort_by is not None and not cls._is_column(sort_by):
+            raise ValueError(f"Field '{sort_by}' doesn't exist.")
+        values = list(values)
+        results = {}
+        for i in range(0, len(values), 500):
+            chunk = values[i:i + 500]
+            query = cls._get_base_query() + f"\nWHERE {field} IN ({', '.join('?' for _ in chunk)})"
+            if sort_by is not None:
+                query += f"\nORDER BY {sort_by} {'ASC' if ascending else 'DESC'}"
+            cursor = c.execute(query, chunk)
+            cursor.row_factory = sqlite3.Row
+            for row in map(cls.from_row, cursor):
+                if row is not None:
+                    results.setdefault(getattr(row, field), []).append(row)
+        return results
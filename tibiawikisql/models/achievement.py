@@ -59,15 +59,13 @@ class Achievement(abc.Row, abc.Parseable, table=schema.Achievement):
     }
     _pattern = re.compile(r"Infobox[\s_]Achievement")
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "grade",
         "points",
         "description",
         "spoiler",
         "secret",
+        "premium",
         "version",
     )
 
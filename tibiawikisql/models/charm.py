@@ -53,9 +53,6 @@ class Charm(abc.Row, abc.Parseable, table=schema.Charm):
     _pattern = re.compile(r"Infobox[\s_]Charm")
 
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "type",
         "effect",
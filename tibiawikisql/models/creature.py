@@ -22,6 +22,7 @@ from tibiawikisql.utils import clean_links, int_pattern, parse_boolean, parse_in
     clean_question_mark
 
 creature_loot_pattern = re.compile(r"\|{{Loot Item\|(?:([\d?+-]+)\|)?([^}|]+)")
+walks_pattern = re.compile(r"([a-z]+)(?=,|$)")
 
 KILLS = {
     "Harmless": 25,
@@ -41,6 +42,9 @@ CHARM_POINTS = {
 
 ELEMENTAL_MODIFIERS = ["physical", "earth", "fire", "ice", "energy", "death", "holy", "drown", "hpdrain"]
 
+WALKABLE_FIELDS = frozenset({"physical", "holy", "death", "fire", "ice", "energy", "earth", "poison"})
+NO_WALKS_VALUES = frozenset({"", "no", "none", "--", ">"})
+
 
 def parse_maximum_integer(value):
     """
@@ -56,13 +60,9 @@ def parse_maximum_integer(value):
     :class:`int`, optional:
         The highest number found, or None if no number is found.
     """
-    if value is None:
-        return None
-    matches = int_pattern.findall(value)
-    try:
-        return max(list(map(int, matches)))
-    except ValueError:
+    if not value:
         return None
+    return max(map(int, int_pattern.findall(value)), default=None)
 
 
 def parse_loot(value):
@@ -79,6 +79,9 @@ def parse_loot(value):
     tuple:
         A tuple containing the amounts and the item name.
     """
+    # Creatures without loot templates skip the regex engine entirely.
+    if "{{Loot Item" not in value:
+        return []
     return creature_loot_pattern.findall(value)
 
 
@@ -103,14 +106,13 @@ def parse_monster_walks(value):
     :class:`str`, optional
         A list of field types, separated by commas.
     """
-    regex = re.compile(r"(physical)(,|$)|(holy)(,|$)|(death)(,|$)|(fire)(,|$)|(ice)(,|$)|(energy)(,|$)|(earth)(,|$)|"
-                       r"(poison)(,|$)")
-    content = ""
-    for match in re.finditer(regex, value.lower().strip()):
-        content += match.group()
-    if not content:
+    value = value.lower().strip()
+    if value in NO_WALKS_VALUES:
         return None
-    return content
+    fields = [f for f in walks_pattern.findall(value) if f in WALKABLE_FIELDS]
+    if not fields:
+        return None
+    return ",".join(fields)
 
 
 class Creature(abc.Row, abc.Parseable, table=schema.Creature):
@@ -241,9 +243,6 @@ class Creature(abc.Row, abc.Parseable, table=schema.Creature):
     _pattern = re.compile(r"Infobox[\s_]Creature")
 
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "article",
         "name",
         "plural",
@@ -373,10 +372,8 @@ class Creature(abc.Row, abc.Parseable, table=schema.Creature):
             A cursor or connection of the database.
         """
         super().insert(c)
-        for attribute in getattr(self, "loot", []):
-            attribute.insert(c)
-        for attribute in getattr(self, "sounds", []):
-            attribute.insert(c)
+        CreatureDrop.insert_many(c, getattr(self, "loot", []))
+        CreatureSound.insert_many(c, getattr(self, "sounds", []))
 
     @classmethod
     def get_by_field(cls, c, field, value, use_like=False):
@@ -427,13 +424,10 @@ class CreatureDrop(abc.Row, table=schema.CreatureDrop):
     def __repr__(self):
         attributes = []
         for attr in self.__slots__:
-            try:
-                v = getattr(self, attr)
-                if v is None:
-                    continue
-                attributes.append(f"{attr}={v!r}")
-            except AttributeError:
-                pass
+            v = getattr(self, attr, None)
+            if v is None:
+                continue
+            attributes.append(f"{attr}={v!r}")
         return f"{self.__class__.__name__}({','.join(attributes)})"
 
     def insert(self, c):
@@ -449,9 +443,37 @@ class CreatureDrop(abc.Row, table=schema.CreatureDrop):
         if getattr(self, "item_id", None):
             super().insert(c)
         else:
-            query = f"""INSERT INTO {self.table.__tablename__}(creature_id, item_id, min, max)
-                        VALUES(?, (SELECT article_id from item WHERE title = ?), ?, ?)"""
-            c.execute(query, (self.creature_id, self.item_title, self.min, self.max))
+            c.execute(self._get_insert_by_title_query(), (self.creature_id, self.item_title, self.min, self.max))
+
+    @classmethod
+    def insert_many(cls, c, rows):
+        """Inserts multiple drops into their respective database.
+
+        Overridden to look up the ids of the items of drops without an item id, using their titles.
+        All the ids are fetched in a single query, so every drop can be inserted in the same batch.
+
+        Parameters
+        ----------
+        c: :class:`sqlite3.Cursor`, :class:`sqlite3.Connection`
+            A cursor or connection of the database.
+        rows: iterable of :class:`CreatureDrop`
+            The drops to insert.
+        """
+        rows = list(rows)
+        titles = {drop.item_title for drop in rows if not getattr(drop, "item_id", None) and drop.item_title}
+        if titles:
+            query = f"SELECT title, article_id FROM item WHERE title IN ({', '.join('?' for _ in titles)})"
+            # Titles are case insensitive in the database.
+            item_ids = {title.lower(): article_id for title, article_id in c.execute(query, tuple(titles))}
+            for drop in rows:
+                if not getattr(drop, "item_id", None) and drop.item_title:
+                    drop.item_id = item_ids.get(drop.item_title.lower())
+        cls.table.insert_many(c, (drop._get_insert_values() for drop in rows))
+
+    @classmethod
+    def _get_insert_by_title_query(cls):
+        return f"""INSERT INTO {cls.table.__tablename__}(creature_id, item_id, min, max)
+                   VALUES(?, (SELECT article_id from item WHERE title = ?), ?, ?)"""
 
     @classmethod
     def _is_column(cls, name):
@@ -484,15 +506,11 @@ class CreatureSound(abc.Row, table=schema.CreatureSound):
     def __repr__(self):
         attributes = []
         for attr in self.__slots__:
-            try:
-                v = getattr(self, attr)
-                if v is None:
-                    continue
-                attributes.append(f"{attr}={v!r}")
-            except AttributeError:
-                pass
+            v = getattr(self, attr, None)
+            if v is None:
+                continue
+            attributes.append(f"{attr}={v!r}")
         return "{0.__class__.__name__}({1})".format(self, ",".join(attributes))
 
-    def insert(self, c):
-        columns = dict(creature_id=self.creature_id, content=self.content)
-        self.table.insert(c, **columns)
+    def _get_insert_values(self):
+        return dict(creature_id=self.creature_id, content=self.content)
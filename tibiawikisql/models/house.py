@@ -12,6 +12,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import re
+
 from tibiawikisql import schema
 from tibiawikisql.models import abc
 from tibiawikisql.utils import convert_tibiawiki_position, parse_integer, clean_links
@@ -61,9 +63,6 @@ class House(abc.Row, abc.Parseable, table=schema.House):
         The client version where this creature was first implemented.
     """
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "house_id",
         "name",
         "guildhall",
@@ -98,6 +97,7 @@ class House(abc.Row, abc.Parseable, table=schema.House):
         "posz": ("z", int),
         "implemented": ("version", str.strip),
     }
+    _pattern = re.compile(r"Infobox[\s_]Building")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -124,9 +124,6 @@ class Imbuement(abc.Row, abc.Parseable, table=schema.Imbuement):
     _pattern = re.compile(r"Infobox[\s_]Imbuement")
 
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "tier",
         "type",
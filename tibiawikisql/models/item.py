@@ -116,9 +116,6 @@ class Item(abc.Row, abc.Parseable, table=schema.Item):
     _pattern = re.compile(r"Infobox[\s_]Item")
 
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "plural",
         "article",
@@ -302,10 +299,8 @@ class Item(abc.Row, abc.Parseable, table=schema.Item):
 
     def insert(self, c):
         super().insert(c)
-        for attribute in getattr(self, "attributes", []):
-            attribute.insert(c)
-        for attribute in getattr(self, "sounds", []):
-            attribute.insert(c)
+        ItemAttribute.insert_many(c, getattr(self, "attributes", []))
+        ItemSound.insert_many(c, getattr(self, "sounds", []))
 
     @classmethod
     def get_by_field(cls, c, field, value, use_like=False):
@@ -320,6 +315,44 @@ class Item(abc.Row, abc.Parseable, table=schema.Item):
         item.sounds = ItemSound.search(c, "item_id", item.article_id)
         return item
 
+    @classmethod
+    def get_many(cls, c, ids):
+        """
+        Gets multiple items by their article ids.
+
+        Child rows are fetched with a single query per table for all items, instead of a set of queries per item.
+
+        Parameters
+        ----------
+        c: :class:`sqlite3.Connection`, :class:`sqlite3.Cursor`
+            A connection or cursor of the database.
+        ids: iterable of :class:`int`
+            The article ids of the items to get.
+
+        Returns
+        -------
+        list of :class:`Item`
+            The items found, in the same order as the ids. Ids that weren't found are skipped.
+        """
+        ids = list(dict.fromkeys(ids))
+        found = cls._search_many(c, "article_id", ids)
+        items = [found[article_id][0] for article_id in ids if article_id in found]
+        ids = [item.article_id for item in items]
+        attributes = ItemAttribute._search_many(c, "item_id", ids)
+        dropped_by = CreatureDrop._search_many(c, "item_id", ids, sort_by="chance", ascending=False)
+        sold_by = NpcSellOffer._search_many(c, "item_id", ids, sort_by="value", ascending=True)
+        bought_by = NpcBuyOffer._search_many(c, "item_id", ids, sort_by="value", ascending=False)
+        awarded_in = QuestReward._search_many(c, "item_id", ids)
+        sounds = ItemSound._search_many(c, "item_id", ids)
+        for item in items:
+            item.attributes = attributes.get(item.article_id, [])
+            item.dropped_by = dropped_by.get(item.article_id, [])
+            item.sold_by = sold_by.get(item.article_id, [])
+            item.bought_by = bought_by.get(item.article_id, [])
+            item.awarded_in = awarded_in.get(item.article_id, [])
+            item.sounds = sounds.get(item.article_id, [])
+        return items
+
 
 class Key(abc.Row, abc.Parseable, table=schema.ItemKey):
     """
@@ -351,9 +384,6 @@ class Key(abc.Row, abc.Parseable, table=schema.ItemKey):
         The client version where this creature was first implemented.
     """
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "number",
         "item_id",
@@ -448,9 +478,8 @@ class ItemAttribute(abc.Row, table=schema.ItemAttribute):
         "value",
     )
 
-    def insert(self, c):
-        columns = dict(item_id=self.item_id, name=self.name, value=clean_links(str(self.value)))
-        self.table.insert(c, **columns)
+    def _get_insert_values(self):
+        return dict(item_id=self.item_id, name=self.name, value=clean_links(str(self.value)))
 
 
 class ItemSound(abc.Row, table=schema.ItemSound):
@@ -475,15 +504,11 @@ class ItemSound(abc.Row, table=schema.ItemSound):
     def __repr__(self):
         attributes = []
         for attr in self.__slots__:
-            try:
-                v = getattr(self, attr)
-                if v is None:
-                    continue
-                attributes.append(f"{attr}={v!r}")
-            except AttributeError:
-                pass
+            v = getattr(self, attr, None)
+            if v is None:
+                continue
+            attributes.append(f"{attr}={v!r}")
         return f"{self.__class__.__name__}({','.join(attributes)})"
 
-    def insert(self, c):
-        columns = dict(item_id=self.item_id, content=self.content)
-        self.table.insert(c, **columns)
+    def _get_insert_values(self):
+        return dict(item_id=self.item_id, content=self.content)
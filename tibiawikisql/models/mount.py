@@ -70,9 +70,6 @@ class Mount(abc.Row, abc.Parseable, table=schema.Mount):
     }
     _pattern = re.compile(r"Infobox[\s_]Mount")
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "speed",
         "taming_method",
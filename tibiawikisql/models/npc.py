@@ -184,7 +184,7 @@ class Npc(abc.Row, abc.Parseable, table=schema.Npc):
     teaches: list of :class:`NpcSpell`
         Spells this NPC can teach.
     """
-    __slots__ = ("article_id", "title", "timestamp", "name", "gender", "race", "job", "location",
+    __slots__ = ("name", "gender", "race", "job", "location",
                  "city", "x", "y", "z", "version", "image", "sell_offers", "buy_offers", "destinations", "teaches")
 
     def __init__(self, **kwargs):
@@ -330,6 +330,8 @@ class Npc(abc.Row, abc.Parseable, table=schema.Npc):
 
 
 class NpcOffer:
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         self.npc_id = kwargs.get("npc_id")
         self.npc_title = kwargs.get("npc_title")
@@ -343,13 +345,10 @@ class NpcOffer:
     def __repr__(self):
         attributes = []
         for attr in self.__slots__:
-            try:
-                v = getattr(self, attr)
-                if v is None:
-                    continue
-                attributes.append(f"{attr}={v!r}")
-            except AttributeError:
-                pass
+            v = getattr(self, attr, None)
+            if v is None:
+                continue
+            attributes.append(f"{attr}={v!r}")
         return f"{self.__class__.__name__}({','.join(attributes)})"
 
 
@@ -524,15 +523,12 @@ class NpcSpell(abc.Row, table=schema.NpcSpell):
     def __repr__(self):
         attributes = []
         for attr in self.__slots__:
-            try:
-                v = getattr(self, attr)
-                if v is None:
-                    continue
-                if isinstance(v, bool) and not v:
-                    continue
-                attributes.append(f"{attr}={v!r}")
-            except AttributeError:
-                pass
+            v = getattr(self, attr, None)
+            if v is None:
+                continue
+            if isinstance(v, bool) and not v:
+                continue
+            attributes.append(f"{attr}={v!r}")
         return "{0.__class__.__name__}({1})".format(self, ",".join(attributes))
 
     def insert(self, c):
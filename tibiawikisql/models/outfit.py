@@ -54,9 +54,6 @@ class Outfit(abc.Row, abc.Parseable, table=schema.Outfit):
         Quests that grant the outfit or its addons.
     """
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "type",
         "premium",
@@ -151,15 +148,12 @@ class OutfitQuest(abc.Row, table=schema.OutfitQuest):
     def __repr__(self):
         attributes = []
         for attr in self.__slots__:
-            try:
-                v = getattr(self, attr)
-                if v is None:
-                    continue
-                if isinstance(v, bool) and not v:
-                    continue
-                attributes.append(f"{attr}={v!r}")
-            except AttributeError:
-                pass
+            v = getattr(self, attr, None)
+            if v is None:
+                continue
+            if isinstance(v, bool) and not v:
+                continue
+            attributes.append(f"{attr}={v!r}")
         return f"{self.__class__.__name__}({','.join(attributes)})"
 
     def insert(self, c):
@@ -80,12 +80,10 @@ class Quest(abc.Row, abc.Parseable, table=schema.Quest):
         Items rewarded in the quest.
     """
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "location",
         "rookgaard",
+        "premium",
         "type",
         "quest_log",
         "legend",
@@ -70,12 +70,10 @@ class Spell(abc.Row, abc.Parseable, table=schema.Spell):
         The spell's image in bytes.
     """
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "words",
         "type",
+        "class",
         "element",
         "mana",
         "soul",
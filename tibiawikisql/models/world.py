@@ -81,9 +81,6 @@ class World(abc.Row, abc.Parseable, table=schema.World):
     _pattern = re.compile(r"Infobox[\s_]World")
 
     __slots__ = (
-        "article_id",
-        "title",
-        "timestamp",
         "name",
         "location",
         "pvp_type",
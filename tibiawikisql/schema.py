@@ -373,3 +373,20 @@ def create_tables(conn):
     for table in Table.all_tables():
         conn.execute(table.drop())
         conn.executescript(table.create_table())
+
+
+def configure_write_connection(conn):
+    """
+    Tunes a connection for bulk loading data into the database.
+
+    Writes are not synced to disk, temporary data is kept in memory and the page cache is increased. The database is
+    expected to be generated from scratch, so it is not protected against crashes during the load.
+
+    Parameters
+    ----------
+    conn: sqlite3.Connection, sqlite3.Cursor
+    """
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA foreign_keys = OFF")